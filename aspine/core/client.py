@@ -3,14 +3,61 @@ import sys
 import time
 import datetime
 import signal
+import socket
 
-from multiprocessing.managers import SyncManager
+from multiprocessing import connection
+from multiprocessing.managers import SyncManager, DictProxy, RemoteError, State, dispatch
+
+
+def _nodelay_client(address, family=None, authkey=None):
+    # Same as multiprocessing.connection.Client, but with Nagle disabled: the
+    # auth handshake ends with two back-to-back small writes, which otherwise
+    # stall every new connection on the server's delayed ACK (~40ms each).
+    sock = socket.create_connection(address)
+    # Connection does plain blocking reads on the fd; undo any timeout picked
+    # up from socket.setdefaulttimeout(), as the stdlib SocketClient does.
+    sock.setblocking(True)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    c = connection.Connection(sock.detach())
+    if authkey is not None:
+        connection.answer_challenge(c, authkey)
+        connection.deliver_challenge(c, authkey)
+    return c
+
+
+# BaseManager and BaseProxy look their connection factory up by serializer
+# name in a module-level table; rather than adding an entry there, these
+# subclasses set their own _Client (a CPython implementation detail) so only
+# Aspine's connections change.
+class _NoDelayDictProxy(DictProxy):
+
+    def __init__(self, *args, incref=True, **kwargs):
+        super().__init__(*args, incref=False, **kwargs)
+        self._Client = _nodelay_client
+        if incref:
+            self._incref()
+
+
+class _NoDelayManager(SyncManager):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._Client = _nodelay_client
+
+    def connect(self):
+        # BaseManager.connect() ignores self._Client, so repeat it here.
+        conn = self._Client(self._address, authkey=self._authkey)
+        try:
+            dispatch(conn, None, "dummy")
+        finally:
+            conn.close()
+        self._state.value = State.STARTED
 
 
 class AspineClient:
     def __init__(self, host: str = "127.0.0.1", port: int = 5116, authkey: str = "123456", *args, **kwargs):
         logging.debug(f"Start initializing client at {datetime.datetime.now()}")
-        self.core = SyncManager(
+        self.core = _NoDelayManager(
             (host, port),
             authkey=authkey.encode()
         )
@@ -18,20 +65,55 @@ class AspineClient:
     def connect(self):
         try:
             self.core.connect()
-            self.core.register("get_mem_data")
+            self.core.register("get_mem_data", proxytype=_NoDelayDictProxy)
             self.core.register("get_manager_info")
 
             self._get_mem_data = getattr(self.core, "get_mem_data")
             self._get_manager_info = getattr(self.core, "get_manager_info")
 
+            # Every call to get_mem_data() opens new authenticated connections
+            # to create and incref a fresh proxy, so fetch it once and reuse it;
+            # _call() rebuilds it if the server goes away underneath it.
+            self._mem_data = self._get_mem_data()
+
         except ConnectionRefusedError as cre:
             logging.error(f"Please check server/manager is up and running.")
             logging.exception(cre)
 
+    def _reset_mem_data(self):
+        old = self._mem_data
+        old._close()
+        # Proxies to one address share a per-thread connection, so drop this
+        # thread's dead one or the new proxy would be handed it straight back.
+        conn = getattr(old._tls, "connection", None)
+        if conn is not None:
+            conn.close()
+            del old._tls.connection
+        self._mem_data = self._get_mem_data()
+
+    def _is_unknown_proxy_error(self, e):
+        # Depends on the format of Server.serve_client's "#TRACEBACK" reply: a
+        # failed id_to_obj lookup ends the remote traceback with the KeyError
+        # for the id, so only that exact last line counts, for our proxy's id.
+        lines = str(e.args[0]).rstrip().splitlines() if e.args else []
+        return bool(lines) and lines[-1] == f"KeyError: {self._mem_data._token.id!r}"
+
+    def _call(self, method_name, *args):
+        # A restarted server closes the cached proxy's connection (EOFError /
+        # ConnectionError) or no longer knows its object id (a RemoteError,
+        # see _is_unknown_proxy_error); rebuild the proxy and retry once.
+        try:
+            return getattr(self._mem_data, method_name)(*args)
+        except (EOFError, ConnectionError, RemoteError) as e:
+            if isinstance(e, RemoteError) and not self._is_unknown_proxy_error(e):
+                raise
+            logging.info(f"Lost data proxy ({e!r}), reconnecting.")
+            self._reset_mem_data()
+            return getattr(self._mem_data, method_name)(*args)
+
     def get(self, key_name):
         try:
-            # self._get_mem_data()._close()
-            res = self._get_mem_data().get(key_name)
+            res = self._call("get", key_name)
             if res is not None:
                 return res
         except Exception as e:
@@ -46,26 +128,22 @@ class AspineClient:
                 "value": value,
                 "set_ts": time.time()
             }}
-            # self._get_mem_data()._close()
-            self._get_mem_data().update(res)
+            self._call("update", res)
         except Exception as e:
             logging.error(f"Error.")
             logging.exception(e)
 
     def is_exist(self, key_name):
         try:
-            r = self.get(key_name)
-            if r is not None:
-                return True
-            else:
-                return False
+            # Membership test on the server; avoids shipping the value back.
+            return self._call("__contains__", key_name)
         except Exception as e:
             logging.error(f"Error.")
             logging.exception(e)
 
     def list(self):
         try:
-            r = self._get_mem_data().keys()
+            r = self._call("keys")
             return r
         except Exception as e:
             logging.error(f"Error.")
@@ -1,21 +1,84 @@
 import logging
+import os
+import pickle
 import sys
+import tempfile
 import time
 import datetime
 import signal
+import threading
 
-from multiprocessing.managers import SyncManager
+from collections import OrderedDict
+from typing import Optional
+from multiprocessing.managers import SyncManager, DictProxy
+
+
+class LRUDict(OrderedDict):
+    # Manager requests are served on one thread per connection, so the
+    # check-then-move/evict steps below need a lock to stay consistent.
+
+    def __init__(self, max_size: int):
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        super().__init__()
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        # pop/clear/etc. are not locked, so the key can vanish mid-way.
+        with self._lock:
+            try:
+                self.move_to_end(key)
+                return self[key]
+            except KeyError:
+                return default
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.max_size:
+                self.popitem(last=False)
+
+    # multiprocessing only knows how to send plain dict views, so hand back
+    # lists taken under the lock instead of live OrderedDict views.
+    def keys(self):
+        with self._lock:
+            return list(super().keys())
+
+    def values(self):
+        with self._lock:
+            return list(super().values())
+
+    def items(self):
+        with self._lock:
+            return list(super().items())
+
+    def copy(self):
+        # OrderedDict.copy() would call LRUDict(self); a plain dict snapshot
+        # is all callers need.
+        with self._lock:
+            return dict(super().items())
 
 
 class AspineServer:
 
-    def __init__(self, host: str = "127.0.0.1", port: int = 5116, authkey: str = "123456", *args, **kwargs):
+    def __init__(self, host: str = "127.0.0.1", port: int = 5116, authkey: str = "123456",
+                 max_size: Optional[int] = None, snapshot_path: Optional[str] = None, *args, **kwargs):
         logging.debug(f"Start initializing manager at {datetime.datetime.now()}")
 
         class HelperManager(SyncManager):
             pass
 
-        self.mem_data = {}
+        # Unbounded by default; with max_size set, the least recently used
+        # keys are evicted once the store holds more than max_size keys.
+        self.mem_data = {} if max_size is None else LRUDict(max_size)
+        self.snapshot_path = snapshot_path
+        # Saves the live store from inside the process that holds it: this one
+        # under run(), the manager process after start(), neither once stopped.
+        self._save_live_store = self._save_snapshot
+        if snapshot_path is not None and os.path.exists(snapshot_path):
+            self._load_snapshot()
         self.manager_info = {
             "app_name": "A-spine data store",
             "start_time": datetime.datetime.now()
@@ -27,32 +90,96 @@ class AspineServer:
         def get_manager_info():
             return self.manager_info
 
-        HelperManager.register("get_mem_data", get_mem_data)
+        def save_snapshot():
+            self._save_snapshot()
+
+        HelperManager.register("get_mem_data", get_mem_data, proxytype=DictProxy)
         HelperManager.register("get_manager_info", get_manager_info)
+        HelperManager.register("save_snapshot", save_snapshot)
         self.manager = HelperManager(
             (host, port),
             authkey=authkey.encode()
         )
 
+    def _load_snapshot(self):
+        logging.info(f"Loading snapshot from {self.snapshot_path}")
+        with open(self.snapshot_path, "rb") as f:
+            self.mem_data.update(pickle.load(f))
+
+    def _save_snapshot(self):
+        if self.snapshot_path is None:
+            return
+        data = self.mem_data.copy()
+        logging.info(f"Saving snapshot of {len(data)} keys to {self.snapshot_path}")
+        # Write and fsync a uniquely named temp file, then rename it over the
+        # old snapshot, so a crash mid-write never leaves a truncated snapshot.
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.snapshot_path)),
+                                        prefix=f"{os.path.basename(self.snapshot_path)}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _save_snapshot_before_stop(self):
+        save, self._save_live_store = self._save_live_store, None
+        if save is None:
+            return
+        try:
+            save()
+        except (ConnectionError, EOFError) as e:
+            # On a process-group SIGTERM the manager process may already have
+            # saved and exited through _stop_manager_process.
+            logging.warning(f"Manager process is gone, snapshot not saved from here: {e!r}")
+        except Exception as e:
+            logging.error(f"Failed to save snapshot.")
+            logging.exception(e)
+
+    def _init_manager_process(self):
+        # Runs in the manager process forked by start(), where mem_data is the
+        # live store: on SIGTERM (a process-group kill, or the terminate()
+        # fallback of manager.shutdown()) save it here, then exit.
+        signal.signal(signal.SIGTERM, self._stop_manager_process)
+
+    def _stop_manager_process(self, signum, frame):
+        logging.info(f"Manager process captured signal with number: {signum}")
+        try:
+            self._save_snapshot()
+        except Exception as e:
+            logging.error(f"Failed to save snapshot.")
+            logging.exception(e)
+        sys.exit(0)
+
     def __shutdown_manager__(self, signum, frame):
 
         logging.info(f"Capture signal with number: {signum}")
         logging.info(f"Existing manager gracefully.")
+        self._save_snapshot_before_stop()
         logging.info(f"Shutting down.")
         self.manager.shutdown()
         sys.exit(0)
 
     def stop(self):
-        self.manager.shutdown()
+        try:
+            self._save_snapshot_before_stop()
+        finally:
+            self.manager.shutdown()
         return self.manager
 
     def start(self):
         signal.signal(signal.SIGINT, self.__shutdown_manager__)
         signal.signal(signal.SIGTERM, self.__shutdown_manager__)
-        self.manager.start()
+        self.manager.start(initializer=self._init_manager_process)
+        # The manager process now owns the live store and saves it on request,
+        # over a fresh connection rather than any proxy this process shares.
+        self._save_live_store = self.manager.save_snapshot
         return self.manager
 
     def run(self):
         signal.signal(signal.SIGINT, self.__shutdown_manager__)
         signal.signal(signal.SIGTERM, self.__shutdown_manager__)
-        self.manager.get_server().serve_forever()
\ No newline at end of file
+        self.manager.get_server().serve_forever()